@@ -16,26 +16,29 @@ def correlation_ratio(categories: pd.Series, values: pd.Series) -> float:
     Eta measures how much of the variance in the numeric variable is explained
     by differences between the category means (0 = no relationship, 1 = perfect).
     """
-    df = pd.DataFrame(
-        {"cat": categories, "val": pd.to_numeric(values, errors="coerce")}
-    ).dropna()
-    if df.empty:
+    numeric = pd.to_numeric(values, errors="coerce")
+    if not categories.index.equals(numeric.index):
+        categories, numeric = categories.align(numeric, join="inner")
+    # One NA mask for both sides, applied once, instead of building a two-column
+    # frame just to dropna() it.
+    complete = categories.notna().to_numpy() & numeric.notna().to_numpy()
+    if not complete.any():
         return float("nan")
+    categories, numeric = categories[complete], numeric[complete]
 
-    overall_mean = df["val"].mean()
+    values_arr = numeric.to_numpy(dtype=float)
+    overall_mean = values_arr.mean()
     if np.isnan(overall_mean):
         return float("nan")
 
-    groups = df.groupby("cat")["val"]
-    ss_between = 0.0
-    for _, g in groups:
-        if g.empty:
-            continue
-        n_g = float(len(g))
-        mean_g = g.mean()
-        ss_between += n_g * (mean_g - overall_mean) ** 2
+    # Per-category size and sum straight from integer codes with np.bincount,
+    # rather than a pandas groupby; factorize only yields categories that occur.
+    codes, _ = pd.factorize(categories)
+    sizes = np.bincount(codes)
+    means = np.bincount(codes, weights=values_arr) / sizes
+    ss_between = float((sizes * (means - overall_mean) ** 2).sum())
 
-    ss_total = float(((df["val"] - overall_mean) ** 2).sum())
+    ss_total = float(((values_arr - overall_mean) ** 2).sum())
     if ss_total <= 0.0:
         return float("nan")
 
@@ -43,61 +46,106 @@ def correlation_ratio(categories: pd.Series, values: pd.Series) -> float:
     return float(eta)
 
 
+def _correlate_pair(
+    col1: pd.Series,
+    col2: pd.Series,
+    is_col1_cat: bool,
+    is_col2_cat: bool,
+    complete: np.ndarray,
+) -> tuple[str, float] | None:
+    """
+    Picks the association measure for one column pair and computes it.
+
+    `complete` marks, by position, the rows where both columns have a value.
+    Returns (correlation type, value), or None when the columns share no rows.
+    """
+    if not complete.any():
+        return None
+
+    aligned_col1, aligned_col2 = col1[complete], col2[complete]
+
+    if not is_col1_cat and not is_col2_cat:
+        # Numeric–numeric: Pearson, straight on the float arrays. The rows are
+        # already paired and complete, so Series.corr's own index alignment and
+        # NaN masking would only repeat work.
+        x = aligned_col1.to_numpy(dtype=float)
+        y = aligned_col2.to_numpy(dtype=float)
+        if len(x) < 2:
+            return "Pearson", float("nan")
+        # A constant column has no variance: the coefficient is NaN, as with
+        # Series.corr, and numpy's divide-by-zero warning is not useful here.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return "Pearson", float(np.corrcoef(x, y)[0, 1])
+    if is_col1_cat and is_col2_cat:
+        # Categorical–categorical: Cramér's V
+        return "Cramér's V", cramers_v(aligned_col1, aligned_col2)
+
+    # Mixed types (one categorical, one numeric): use correlation ratio (eta)
+    if is_col1_cat:
+        cat, num = aligned_col1, aligned_col2
+    else:
+        cat, num = aligned_col2, aligned_col1
+    return "Correlation ratio (eta)", correlation_ratio(cat, num)
+
+
 def run(df: pd.DataFrame, step: schemas.CorrelationAnalysis) -> schemas.ReportBlock:
     """Calculates statistical correlations and returns a structured ReportBlock."""
     correlation_records = []
 
+    # Column pairs depend only on the step, so build them once rather than per group.
+    column_pairs = list(itertools.combinations(step.columns, 2))
+
     data_groups = prepare_data_groups(df, step)
     for group_name, group_df in data_groups:
         if group_df.empty:
             continue
 
         formatted_group_name = format_group_name(group_name)
-        column_pairs = list(itertools.combinations(step.columns, 2))
 
         # Pre-compute categorical classification once per column per group
-        # rather than re-checking dtype on every pair.
-        col_is_categorical: dict[str, bool] = {
-            col: is_categorical(group_df[col])
-            for col in step.columns
-            if col in group_df.columns
-        }
+        # rather than re-checking dtype on every pair. Categorical columns are
+        # hashed into category codes at the same time, so every pair's
+        # crosstab/groupby works on the codes instead of re-hashing the raw
+        # strings. Each column's missing-value mask is taken here too, once per
+        # column; a pair then keeps the rows where both masks hold, by position,
+        # instead of joining the two columns' indexes.
+        col_is_categorical: dict[str, bool] = {}
+        group_columns: dict[str, pd.Series] = {}
+        group_notna: dict[str, np.ndarray] = {}
+        for col in step.columns:
+            if col not in group_df.columns:
+                continue
+            series = group_df[col]
+            if series.dtype == object:
+                # Hash first: the category dtype then tells whether the column
+                # holds only strings by inspecting its distinct values, not
+                # every cell. Missing values keep a column non-categorical, as
+                # they do for the plain object check.
+                as_category = series.astype("category")
+                is_cat = is_categorical(as_category) and not as_category.hasnans
+            else:
+                is_cat = is_categorical(series)
+                as_category = series.astype("category") if is_cat else series
+            col_is_categorical[col] = is_cat
+            group_columns[col] = as_category if is_cat else series
+            group_notna[col] = series.notna().to_numpy()
 
         for col1_name, col2_name in column_pairs:
-            if col1_name not in group_df.columns or col2_name not in group_df.columns:
+            # Flags exist exactly for the columns present in this group.
+            if col1_name not in col_is_categorical or col2_name not in col_is_categorical:
                 continue
 
-            col1, col2 = group_df[col1_name].dropna(), group_df[col2_name].dropna()
-            aligned_col1, aligned_col2 = col1.align(col2, join="inner")
-
-            if aligned_col1.empty:
+            result = _correlate_pair(
+                group_columns[col1_name],
+                group_columns[col2_name],
+                col_is_categorical[col1_name],
+                col_is_categorical[col2_name],
+                group_notna[col1_name] & group_notna[col2_name],
+            )
+            if result is None:
                 continue
 
-            is_col1_cat = col_is_categorical[col1_name]
-            is_col2_cat = col_is_categorical[col2_name]
-
-            if not is_col1_cat and not is_col2_cat:
-                # Numeric–numeric: Pearson
-                corr_type, corr_val = "Pearson", aligned_col1.corr(aligned_col2)
-            elif is_col1_cat and is_col2_cat:
-                # Categorical–categorical: Cramér's V
-                corr_type, corr_val = (
-                    "Cramér's V",
-                    cramers_v(aligned_col1, aligned_col2),
-                )
-            else:
-                # Mixed types (one categorical, one numeric): use correlation ratio (eta)
-                if is_col1_cat and not is_col2_cat:
-                    cat, num = aligned_col1, aligned_col2
-                elif is_col2_cat and not is_col1_cat:
-                    cat, num = aligned_col2, aligned_col1
-                else:
-                    # If we somehow can't classify, skip this pair
-                    continue
-                corr_type, corr_val = (
-                    "Correlation ratio (eta)",
-                    correlation_ratio(cat, num),
-                )
+            corr_type, corr_val = result
 
             if pd.isna(corr_val) or abs(corr_val) < step.threshold:
                 continue
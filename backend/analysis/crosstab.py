@@ -1,12 +1,41 @@
 import logging
+import numpy as np
 import pandas as pd
 import schemas
 
 logger = logging.getLogger(__name__)
-from .helpers import prepare_data_groups, format_group_name
+from .helpers import prepare_data_groups, format_group_name, as_text
 
 
-ALLOWED_TRANSFORMATIONS = {"split_and_explode", "strip_whitespace", "fill_na", "to_root_node"}
+ALLOWED_TRANSFORMATIONS = frozenset(
+    {"split_and_explode", "strip_whitespace", "fill_na", "to_root_node"}
+)
+
+
+def _crosstab_counts(index: pd.Series, columns: pd.Series) -> pd.DataFrame:
+    """
+    Frequency table of two aligned, NaN-free series with "All" margins, laid out
+    like pd.crosstab(index, columns, margins=True).
+
+    Both sides are factorized to sorted integer codes and the pair counts come from
+    one np.bincount, instead of pd.crosstab's pivot_table/groupby machinery.
+    """
+    row_codes, row_labels = pd.factorize(index, sort=True)
+    col_codes, col_labels = pd.factorize(columns, sort=True)
+    n_rows, n_cols = len(row_labels), len(col_labels)
+
+    counts = np.zeros((n_rows + 1, n_cols + 1), dtype=np.int64)
+    counts[:n_rows, :n_cols] = np.bincount(
+        row_codes * n_cols + col_codes, minlength=n_rows * n_cols
+    ).reshape(n_rows, n_cols)
+    counts[:n_rows, n_cols] = counts[:n_rows, :n_cols].sum(axis=1)
+    counts[n_rows] = counts[:n_rows].sum(axis=0)
+
+    return pd.DataFrame(
+        counts,
+        index=pd.Index([*row_labels, "All"], dtype=object, name=index.name),
+        columns=pd.Index([*col_labels, "All"], dtype=object, name=columns.name),
+    )
 
 
 def run(df: pd.DataFrame, step: schemas.CrosstabAnalysis) -> schemas.ReportBlock:
@@ -15,13 +44,36 @@ def run(df: pd.DataFrame, step: schemas.CrosstabAnalysis) -> schemas.ReportBlock
     """
     all_crosstab_dfs = []
 
-    if step.column_transformations:
-        for col_trans in step.column_transformations:
-            for trans in col_trans.transformations:
-                if trans.action not in ALLOWED_TRANSFORMATIONS:
-                    raise ValueError(
-                        f"Transformation '{trans.action}' is not supported by Crosstab Analysis."
-                    )
+    # Validate and resolve the transformation parameters once for the whole step,
+    # rather than re-reading them for every group.
+    column_plans: list[tuple[str, list[tuple[str, object]]]] = []
+    for col_trans in step.column_transformations or []:
+        plan = []
+        for trans in col_trans.transformations:
+            if trans.action not in ALLOWED_TRANSFORMATIONS:
+                raise ValueError(
+                    f"Transformation '{trans.action}' is not supported by Crosstab Analysis."
+                )
+            if trans.action == "split_and_explode":
+                plan.append((trans.action, trans.params.get("delimiter", ",")))
+            elif trans.action == "fill_na":
+                plan.append((trans.action, trans.params.get("value", "")))
+            else:
+                plan.append((trans.action, None))
+        column_plans.append((col_trans.column_name, plan))
+
+    # Only columns that are split hold lists; exploding any other column is a
+    # no-op that still rebuilds the whole frame, so those passes are skipped.
+    split_columns = {
+        column_name
+        for column_name, plan in column_plans
+        if any(action == "split_and_explode" for action, _ in plan)
+    }
+    explode_columns = [
+        column
+        for column in (step.index_column, step.column_to_compare)
+        if column in split_columns
+    ]
 
     data_groups = prepare_data_groups(df, step)
 
@@ -29,48 +81,36 @@ def run(df: pd.DataFrame, step: schemas.CrosstabAnalysis) -> schemas.ReportBlock
         if group_df.empty:
             continue
 
-        working_df = (
-            group_df[[step.index_column, step.column_to_compare]].copy().dropna()
-        )
+        # dropna() already returns a new frame, so no separate copy is needed.
+        working_df = group_df[[step.index_column, step.column_to_compare]].dropna()
+
+        for column_name, plan in column_plans:
+            if column_name not in working_df.columns:
+                continue
+            for action, param in plan:
+                if action == "split_and_explode":
+                    # Produce list values so working_df.explode() below can expand rows.
+                    # Do NOT call .explode() here — that returns scalars with repeated
+                    # indices which pandas cannot assign back to the DataFrame correctly.
+                    working_df[column_name] = (
+                        as_text(working_df[column_name]).str.split(param, regex=False)
+                    )
+                elif action == "strip_whitespace":
+                    working_df[column_name] = (
+                        as_text(working_df[column_name]).str.strip()
+                    )
+                elif action == "fill_na":
+                    working_df[column_name] = working_df[column_name].fillna(param)
 
-        if step.column_transformations:
-            for col_trans in step.column_transformations:
-                if col_trans.column_name not in working_df.columns:
-                    continue
-                for trans in col_trans.transformations:
-                    if trans.action == "split_and_explode":
-                        delimiter = trans.params.get("delimiter", ",")
-                        # Produce list values so working_df.explode() below can expand rows.
-                        # Do NOT call .explode() here — that returns scalars with repeated
-                        # indices which pandas cannot assign back to the DataFrame correctly.
-                        working_df[col_trans.column_name] = (
-                            working_df[col_trans.column_name]
-                            .astype(str)
-                            .str.split(delimiter)
-                        )
-                    elif trans.action == "strip_whitespace":
-                        working_df[col_trans.column_name] = (
-                            working_df[col_trans.column_name].astype(str).str.strip()
-                        )
-                    elif trans.action == "fill_na":
-                        fill_value = trans.params.get("value", "")
-                        working_df[col_trans.column_name] = (
-                            working_df[col_trans.column_name].fillna(fill_value)
-                        )
-
-        working_df = (
-            working_df.explode(step.index_column)
-            .explode(step.column_to_compare)
-            .dropna()
-        )
+        for column in explode_columns:
+            working_df = working_df.explode(column)
+        working_df = working_df.dropna()
 
         if working_df.empty:
             continue
 
-        crosstab_result = pd.crosstab(
-            working_df[step.index_column],
-            working_df[step.column_to_compare],
-            margins=True,
+        crosstab_result = _crosstab_counts(
+            working_df[step.index_column], working_df[step.column_to_compare]
         )
 
         if step.show_percentages == "index":
@@ -1,22 +1,85 @@
 # backend/app/analysis/helpers.py
+import operator
+
 import pandas as pd
 import schemas
 
-# from __future__ import annotations
 from typing import List
-from scipy.stats import chi2_contingency
 import numpy as np
 
 
+class _SpecialCharTable(dict):
+    """
+    str.translate table for remove_special_chars: deletes every character that
+    is not alphanumeric, "_" or whitespace, and maps the rest to themselves.
+
+    Entries are filled lazily on first sight of a code point, so the table only
+    ever holds the characters that actually occur instead of all of Unicode.
+    """
+
+    def __missing__(self, code_point: int):
+        char = chr(code_point)
+        keep = char.isalnum() or char == "_" or char.isspace()
+        value = code_point if keep else None
+        self[code_point] = value
+        return value
+
+
+_SPECIAL_CHARS_TABLE = _SpecialCharTable()
+
+
+def as_text(series: pd.Series) -> pd.Series:
+    """
+    The series as Python strings, i.e. what series.astype(str) returns.
+
+    Object columns that already hold only strings (no missing values) are returned
+    as-is; astype(str) would otherwise rebuild an identical column, which adds up
+    when transformations are chained.
+    """
+    if series.dtype == object and pd.api.types.is_string_dtype(series):
+        return series
+    return series.astype(str)
+
+
+def _contains_mask(col: pd.Series, value) -> pd.Series:
+    """
+    Literal substring match: user text is not a regex, so characters like "(" or
+    "+" must not be parsed, and a plain find cannot backtrack.
+    """
+    return as_text(col).str.contains(str(value), regex=False, na=False)
+
+
+# Row mask builders for schemas.Filter operators, looked up once per filter
+# instead of walking an if/elif chain.
+_FILTER_MASKS = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "in": pd.Series.isin,
+    "not_in": lambda col, value: ~col.isin(value),
+    "contains": _contains_mask,
+}
+
+
 def prepare_data_groups(df: pd.DataFrame, step: schemas.BaseAnalysis) -> list:
     """
     Applies filters and then groups the data. Enforces the correct order of operations.
     Returns an iterable of (group_name, group_dataframe).
+
+    The input is not copied: filtering already builds a new frame, and without
+    filters the caller's DataFrame is yielded as-is. Analysis modules treat group
+    frames as read-only and copy the columns they need before mutating them.
+
+    Filters narrow a boolean row mask in order, each one evaluated only on the rows
+    still kept, so the filtered frame is materialized once rather than once per
+    filter.
     """
-    filtered_df = df.copy()
+    filtered_df = df
     if step.filters:
+        keep = np.ones(len(df), dtype=bool)
         for f in step.filters:
-            col = filtered_df[f.column]
+            col = df[f.column]
 
             # Defensive guard: Filter.column should resolve to a Series, not a DataFrame.
             if isinstance(col, pd.DataFrame):
@@ -25,22 +88,21 @@ def prepare_data_groups(df: pd.DataFrame, step: schemas.BaseAnalysis) -> list:
                     "Check your filter configuration."
                 )
 
-            if f.operator == "eq":
-                filtered_df = filtered_df[col == f.value]
-            elif f.operator == "neq":
-                filtered_df = filtered_df[col != f.value]
-            elif f.operator == "gt":
-                filtered_df = filtered_df[col > f.value]
-            elif f.operator == "lt":
-                filtered_df = filtered_df[col < f.value]
-            elif f.operator == "in":
-                filtered_df = filtered_df[col.isin(f.value)]
-            elif f.operator == "not_in":
-                filtered_df = filtered_df[~col.isin(f.value)]
-            elif f.operator == "contains":
-                filtered_df = filtered_df[
-                    col.astype(str).str.contains(f.value, na=False)
-                ]
+            mask_for = _FILTER_MASKS.get(f.operator)
+            if mask_for is None:
+                continue
+
+            # Only the rows earlier filters kept are compared, exactly as when the
+            # filters are applied one after another: a gt/lt on a mixed-type column
+            # must not see the strings an earlier filter already dropped.
+            rows = np.flatnonzero(keep)
+            if len(rows) < len(keep):
+                col = col.iloc[rows]
+            # Missing comparison results (nullable dtypes) drop the row, as they do
+            # when indexing with the mask directly.
+            keep[rows] = mask_for(col, f.value).to_numpy(dtype=bool, na_value=False)
+
+        filtered_df = df[keep]
 
     if step.group_by:
         return filtered_df.groupby(step.group_by, dropna=False)
@@ -57,6 +119,47 @@ def format_group_name(group_name) -> str:
     return str(group_name)
 
 
+def _dedup_within_cells(s: pd.Series, delimiter: str) -> pd.Series:
+    """
+    Split each cell by delimiter, drop empty and repeated entries (case-sensitive,
+    first occurrence wins), then rejoin with " {delimiter} ".
+
+    Split, strip, dedup and join are fused into one pass per cell (dict.fromkeys
+    keeps first-seen order), which beats the equivalent chain of whole-column
+    split/explode/strip/drop_duplicates/groupby passes and their intermediate
+    Series. Cells without the delimiter hold a single entry and are only stripped.
+    """
+    joiner = f" {delimiter} "
+    values = [
+        joiner.join(
+            dict.fromkeys(
+                token for token in (part.strip() for part in cell.split(delimiter))
+                if token
+            )
+        )
+        if delimiter in cell
+        else cell.strip()
+        for cell in s.to_numpy(dtype=object)
+    ]
+    return pd.Series(values, index=s.index, name=s.name, dtype=object)
+
+
+def _remove_special_chars(s: pd.Series) -> pd.Series:
+    """
+    Strip every character that is not alphanumeric, whitespace, or underscore.
+
+    Purely alphanumeric cells have nothing to strip, so a cheap str.isalnum()
+    check screens them out and only the remaining cells are translated.
+    """
+    values = s.to_numpy(dtype=object, copy=True)
+    needs_sub = ~s.str.isalnum().to_numpy(dtype=bool)
+    if needs_sub.any():
+        values[needs_sub] = (
+            s[needs_sub].str.translate(_SPECIAL_CHARS_TABLE).to_numpy()
+        )
+    return pd.Series(values, index=s.index, name=s.name)
+
+
 def apply_transformations(
     series: pd.Series,
     transformations: List[schemas.Transformation],
@@ -70,6 +173,11 @@ def apply_transformations(
             f"apply_transformations expects a pandas Series, got {type(series)}"
         )
 
+    # Nothing to apply (the common case for custom steps): return the input as-is
+    # rather than a copy, since callers only read the result.
+    if not transformations and not post_filters:
+        return series
+
     s = series.copy()
 
     for trans in transformations:
@@ -81,33 +189,27 @@ def apply_transformations(
             # regex=False forces exact string matching — without it, characters like
             # | are interpreted as regex metacharacters (OR operator), causing
             # incorrect splits on every word instead of the intended delimiter.
-            s = s.astype(str).str.split(delimiter, regex=False).explode()
+            s = as_text(s).str.split(delimiter, regex=False).explode()
         elif action == "to_root_node":
             delimiter = params.get("delimiter")
             if not delimiter:
                 raise ValueError("to_root_node requires a 'delimiter' in params.")
-            s = s.astype(str).str.split(delimiter, regex=False).str[0]
+            # n=1: only the root is kept, so stop after the first delimiter
+            # instead of materializing every part of the path.
+            s = as_text(s).str.split(delimiter, n=1, regex=False).str[0]
         elif action == "strip_whitespace":
-            s = s.astype(str).str.strip()
+            s = as_text(s).str.strip()
         elif action == "to_numeric":
             s = pd.to_numeric(s, errors="coerce")
         elif action == "fill_na":
             s = s.fillna(params.get("value", 0))
         elif action == "remove_special_chars":
-            # Strip every character that is not alphanumeric, whitespace, or underscore.
-            s = s.astype(str).str.replace(r"[^\w\s]", "", regex=True)
+            s = _remove_special_chars(as_text(s))
         elif action == "deduplicate_within_cell":
             # Split each cell by delimiter, remove duplicate entries (case-sensitive),
             # then rejoin with the same delimiter.
             delimiter = params.get("delimiter", "|")
-            def _dedup(val: str) -> str:
-                parts = [p.strip() for p in val.split(delimiter)]
-                seen: list[str] = []
-                for p in parts:
-                    if p and p not in seen:
-                        seen.append(p)
-                return f" {delimiter} ".join(seen)
-            s = s.astype(str).apply(_dedup)
+            s = _dedup_within_cells(as_text(s), delimiter)
 
     if post_filters:
         for f in post_filters:
@@ -124,7 +226,7 @@ def apply_transformations(
             elif f.operator == "not_in":
                 s = s[~s.isin(f.value)]
             elif f.operator == "contains":
-                s = s[s.astype(str).str.contains(f.value, na=False)]
+                s = s[as_text(s).str.contains(str(f.value), regex=False, na=False)]
 
     return s
 
@@ -144,21 +246,48 @@ def cramers_v(x: pd.Series, y: pd.Series) -> float:
     Calculates Cramér's V statistic for categorical-categorical association.
     This is a pure, self-contained statistical function.
     """
-    # --- Create a contingency table (crosstab) of the two series.
-    confusion_matrix = pd.crosstab(x, y)
+    # --- Create a contingency table of the two (element-wise aligned) series.
+    # Both columns are factorized to integer codes and the pair counts come from
+    # a single np.bincount, instead of pd.crosstab's groupby/pivot machinery.
+    x_codes, x_uniques = pd.factorize(x)
+    y_codes, y_uniques = pd.factorize(y)
+    paired = (x_codes >= 0) & (y_codes >= 0)
+    n_rows, n_cols = len(x_uniques), len(y_uniques)
+    confusion_matrix = np.bincount(
+        x_codes[paired] * n_cols + y_codes[paired], minlength=n_rows * n_cols
+    ).reshape(n_rows, n_cols)
+    # Like pd.crosstab, keep only categories that occur in a complete pair.
+    confusion_matrix = confusion_matrix[confusion_matrix.sum(axis=1) > 0]
+    confusion_matrix = confusion_matrix[:, confusion_matrix.sum(axis=0) > 0]
 
-    # --- Chi-squared test: This tests whether the observed distribution of
-    # frequencies differs from the expected distribution.
-    # chi2, _, _, _ = chi2_contingency(confusion_matrix)
-    chi2, _, _, _ = chi2_contingency(confusion_matrix, correction=False)
+    n = confusion_matrix.sum()
+    if n == 0:
+        return 0.0
+
+    r, k = confusion_matrix.shape
+    # A single row or column means V is undefined (0/0) and the pair is dropped
+    # by callers anyway, so skip the chi-squared test entirely.
+    if min(r, k) < 2:
+        return float("nan")
+
+    # --- Chi-squared statistic: This tests whether the observed distribution of
+    # frequencies differs from the expected distribution. With expected counts
+    # E = outer(row_sums, col_sums) / n, sum((O - E)^2 / E) reduces to
+    # n * (sum(O^2 / (row_sum * col_sum)) - 1), so E is never materialized and
+    # only the statistic is computed (no p-value, unlike chi2_contingency).
+    row_sums = confusion_matrix.sum(axis=1)
+    col_sums = confusion_matrix.sum(axis=0)
+    observed = confusion_matrix.astype(float)
+    chi2 = n * (
+        np.einsum("ij,ij,i,j->", observed, observed, 1.0 / row_sums, 1.0 / col_sums)
+        - 1.0
+    )
+    # Exact independence gives 0; rounding in the subtraction can land just below.
+    chi2 = max(chi2, 0.0)
 
     # --- Calculate Cramér's V from the Chi-squared value.
     # It normalizes Chi-squared from 0 (no association) to 1 (perfect association).
-    n = confusion_matrix.sum().sum()
-    if n == 0:
-        return 0.0
     phi2 = chi2 / n
-    r, k = confusion_matrix.shape
 
     # --- The formula for Cramér's V.
     # It adjusts for the number of rows and columns in the contingency table.
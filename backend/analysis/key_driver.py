@@ -28,7 +28,7 @@ def run(df: pd.DataFrame, step: schemas.KeyDriverAnalysis) -> schemas.ReportBloc
 
         # 1. Data preparation
         all_cols = [step.target_variable] + step.feature_columns
-        working_df = group_df[all_cols].copy().dropna(subset=all_cols)
+        working_df = group_df[all_cols].dropna(subset=all_cols)
 
         # Separate numeric and categorical features based on the schema
         categorical_features = step.categorical_features or []
@@ -71,15 +71,17 @@ def run(df: pd.DataFrame, step: schemas.KeyDriverAnalysis) -> schemas.ReportBloc
 
         try:
             model = sm.OLS(Y, X).fit()
-            results_summary = model.summary2()
-            coeffs_df = results_summary.tables[1]
-
-            p_col = "P>|t|"
-            if p_col not in coeffs_df.columns:
-                # Unexpected layout; skip this group
-                continue
+            # Read the coefficient table straight off the fitted results instead of
+            # building summary2(), which also renders text tables and diagnostics.
+            coeffs_df = pd.DataFrame(
+                {
+                    "Coefficient": model.params,
+                    "Standard Error": model.bse,
+                    "P-value": model.pvalues,
+                }
+            )
 
-            significant_rows_mask = coeffs_df[p_col] < step.p_value_threshold
+            significant_rows_mask = coeffs_df["P-value"] < step.p_value_threshold
 
             if step.include_intercept and "const" in coeffs_df.index:
                 # Always keep intercept if it exists
@@ -87,20 +89,7 @@ def run(df: pd.DataFrame, step: schemas.KeyDriverAnalysis) -> schemas.ReportBloc
 
             coeffs_df = coeffs_df[significant_rows_mask]
 
-            # Rename columns to a clean, stable schema
-            coeffs_df = coeffs_df.rename(
-                columns={
-                    "Coef.": "Coefficient",
-                    "Std.Err.": "Standard Error",
-                    p_col: "P-value",
-                }
-            )
-
-            result_df = (
-                coeffs_df[["Coefficient", "Standard Error", "P-value"]]
-                .reset_index()
-                .rename(columns={"index": "Feature"})
-            )
+            result_df = coeffs_df.reset_index().rename(columns={"index": "Feature"})
             result_df["Group"] = formatted_group_name
 
             # Round numeric fields to 2 decimal places for presentation
@@ -1,11 +1,15 @@
-import math
 from typing import Dict
 
 import numpy as np
 import pandas as pd
 
 import schemas
-from .helpers import prepare_data_groups, format_group_name, apply_transformations
+from .helpers import (
+    prepare_data_groups,
+    format_group_name,
+    apply_transformations,
+    as_text,
+)
 
 
 def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
@@ -29,19 +33,9 @@ def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
 
     multi_context = bool(step.group_by) or len(step.target_columns) > 1
 
-    include_group_fields = multi_context and op in ("average", "sum", "median")
+    include_group_fields = multi_context and op in _METRIC_LABEL_PREFIXES
 
-    # Dispatcher for helper functions
-    op_handlers = {
-        "average": _op_average,
-        "sum": _op_sum,
-        "median": _op_median,
-        "distribution": _op_distribution,
-        "duplicate_count": _op_duplicate_count,
-        "list_unique_values": _op_list_unique_values,
-    }
-
-    handler = op_handlers.get(op)
+    handler = _OP_HANDLERS.get(op)
     if not handler:
         # Unknown operation → return a small error block
         error_df = pd.DataFrame([{"Error": f"Unknown custom operation: '{op}'"}])
@@ -117,20 +111,15 @@ def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
             include_group_fields
             and group_fields
             and len(step.target_columns) == 1
-            and op in ("average", "sum", "median")
+            and op in _METRIC_LABEL_PREFIXES
             and {"Group", "Column"}.issubset(final_df.columns)
         ):
-            exclude = set(["Group", "Column"] + list(group_fields))
+            exclude = {"Group", "Column", *group_fields}
             metric_cols = [c for c in final_df.columns if c not in exclude]
 
             if metric_cols:
                 target_label = step.target_columns[0]
-                metric_label_map = {
-                    "average": "Average of",
-                    "sum": "Sum of",
-                    "median": "Median of",
-                }
-                prefix = metric_label_map.get(op, "Value for")
+                prefix = _METRIC_LABEL_PREFIXES.get(op, "Value for")
                 new_metric_name = f"{prefix} {target_label}"
                 final_df = final_df.rename(columns={metric_cols[0]: new_metric_name})
                 metric_cols[0] = new_metric_name
@@ -147,30 +136,13 @@ def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
             # Ensure stable column order for distribution tables
             value_col = ""
             core_cols = [value_col, "%", "Count"]
-            pretty_rows: list[dict] = []
+            pretty_rows: list[tuple] = []
 
             for (grp, col), sub in final_df.groupby(["Group", "Column"], sort=False):
                 # Section header row
-                pretty_rows.append(
-                    {
-                        "Group": grp,
-                        "Column": col,
-                        value_col: "",
-                        "%": "",
-                        "Count": "",
-                    }
-                )
+                pretty_rows.append((grp, col, "", "", ""))
                 # Detail rows: one per distinct value
-                for _, r in sub.iterrows():
-                    pretty_rows.append(
-                        {
-                            "Group": "",
-                            "Column": "",
-                            value_col: r.get(value_col, ""),
-                            "%": r.get("%", ""),
-                            "Count": r.get("Count", ""),
-                        }
-                    )
+                pretty_rows.extend(_detail_rows(sub, core_cols))
 
             final_df = pd.DataFrame(
                 pretty_rows, columns=["Group", "Column"] + core_cols
@@ -185,24 +157,9 @@ def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
 
             for (grp, col), sub in final_df.groupby(["Group", "Column"], sort=False):
                 # Section header row
-                pretty_rows.append(
-                    {
-                        "Group": grp,
-                        "Column": col,
-                        "Duplicates": "",
-                        "Instances": "",
-                    }
-                )
+                pretty_rows.append((grp, col, "", ""))
                 # Detail rows: one per duplicated value
-                for _, r in sub.iterrows():
-                    pretty_rows.append(
-                        {
-                            "Group": "",
-                            "Column": "",
-                            "Duplicates": r.get("Duplicates", ""),
-                            "Instances": r.get("Instances", ""),
-                        }
-                    )
+                pretty_rows.extend(_detail_rows(sub, ["Duplicates", "Instances"]))
 
             final_df = pd.DataFrame(
                 pretty_rows, columns=["Group", "Column", "Duplicates", "Instances"]
@@ -236,7 +193,20 @@ def run(df: pd.DataFrame, step: schemas.CustomAnalysis) -> schemas.ReportBlock:
 # --- HELPER FUNCTIONS ---
 
 
-def _compute_percentages(counts: pd.Series) -> pd.Series:
+def _detail_rows(sub: pd.DataFrame, columns: list[str]) -> list[tuple]:
+    """
+    Detail rows for a grouped section: blank Group/Column cells followed by the
+    requested payload columns ("" where a column is absent).
+
+    Built column-wise as plain tuples instead of one Series per row via iterrows.
+    """
+    n = len(sub)
+    values = [sub[c].tolist() if c in sub.columns else [""] * n for c in columns]
+    blanks = [""] * n
+    return list(zip(blanks, blanks, *values))
+
+
+def _compute_percentages(counts: pd.Series) -> np.ndarray:
     """
     Turn counts into integer percentages that sum to 100.
 
@@ -244,26 +214,42 @@ def _compute_percentages(counts: pd.Series) -> pd.Series:
     - Compute raw percentages.
     - Take floors.
     - Distribute remaining points to the largest fractional parts.
+
+    Returns a plain int array positionally aligned with `counts` (input order);
+    callers zip it with their labels, so no indexed Series is built.
     """
     total = int(counts.sum())
     if total <= 0:
-        return pd.Series([0] * len(counts), index=counts.index)
+        return np.zeros(len(counts), dtype=np.int64)
 
-    raw = (counts.astype(float) * 100.0) / float(total)
-    floors = raw.apply(math.floor)
+    # Exact integer arithmetic: floors of count * 100 / total, and the leftover
+    # of each division standing in for its fractional part (no float rounding).
+    scaled = counts.to_numpy(dtype=np.int64) * 100
+    floors = scaled // total
+    fractions = scaled - floors * total
     remainder = int(100 - floors.sum())
 
-    fracs = raw - floors
-    order = list(fracs.sort_values(ascending=False).index)
+    # The leftover points (always fewer than the number of values) go one each
+    # to the largest fractional parts, ties broken by the label's text like
+    # Report_Housing's sorted(key=(-frac, str(label))), as one C-level lexsort.
+    if remainder > 0:
+        labels = counts.index.astype(str).to_numpy()
+        order = np.lexsort((labels, -fractions))
+        floors[order[:remainder]] += 1
 
-    i = 0
-    while remainder > 0 and order:
-        key = order[i % len(order)]
-        floors.loc[key] += 1
-        remainder -= 1
-        i += 1
+    return floors
 
-    return floors.astype(int)
+
+def _numeric_values(series: pd.Series) -> pd.Series:
+    """
+    The non-missing numeric values of a series for the average/sum/median ops.
+
+    Columns that already have a numeric dtype skip pd.to_numeric entirely; only
+    text columns go through the parsing/coercion path.
+    """
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors="coerce")
+    return series.dropna()
 
 
 def _op_average(series: pd.Series) -> pd.DataFrame:
@@ -274,7 +260,7 @@ def _op_average(series: pd.Series) -> pd.DataFrame:
     - Single column named 'Average'
     - Single row with the mean of the series (rounded to 2 decimals)
     """
-    numeric_series = pd.to_numeric(series, errors="coerce").dropna()
+    numeric_series = _numeric_values(series)
     if numeric_series.empty:
         return pd.DataFrame({"Average": [pd.NA]})
     mean_val = float(round(numeric_series.mean(), 2))
@@ -289,7 +275,7 @@ def _op_sum(series: pd.Series) -> pd.DataFrame:
     - Single column named 'Sum'
     - Single row with the sum of the series (rounded to 2 decimals)
     """
-    numeric_series = pd.to_numeric(series, errors="coerce").dropna()
+    numeric_series = _numeric_values(series)
     if numeric_series.empty:
         return pd.DataFrame({"Sum": [pd.NA]})
     sum_val = float(round(numeric_series.sum(), 2))
@@ -302,7 +288,7 @@ def _op_median(series: pd.Series) -> pd.DataFrame:
         return pd.DataFrame({"Median": [pd.NA]})
 
     # 1) Try numeric median
-    numeric_series = pd.to_numeric(s, errors="coerce").dropna()
+    numeric_series = _numeric_values(s)
     if not numeric_series.empty:
         median_val = float(round(numeric_series.median(), 2))
         return pd.DataFrame({"Median": [median_val]})
@@ -326,21 +312,31 @@ def _op_duplicate_count(series: pd.Series) -> pd.DataFrame:
     - Columns: 'Duplicates', 'Instances'
     - One row per value that appears more than once in the series.
     """
-    # Normalize to string for counting
-    s = series.dropna().astype(str)
+    # Normalize to string for counting (skipped when the values already are strings)
+    s = as_text(series.dropna())
     if s.empty:
         return pd.DataFrame(columns=["Duplicates", "Instances"])
 
-    counts = s.value_counts()
-    dupes = counts[counts > 1]
+    # Factorize to dense integer codes and count them with np.bincount; the >1
+    # filter and the ordering then run on plain arrays.
+    codes, uniques = pd.factorize(s)
+    counts = np.bincount(codes)
+    is_dupe = counts > 1
 
-    if dupes.empty:
+    if not is_dupe.any():
         return pd.DataFrame(columns=["Duplicates", "Instances"])
 
-    df = dupes.reset_index()
-    df.columns = ["Duplicates", "Instances"]
-    df["Instances"] = df["Instances"].astype(int)
-    return df
+    dup_values = np.asarray(uniques)[is_dupe]
+    dup_counts = counts[is_dupe]
+    # Most frequent first, ties broken alphabetically (Report_Housing ordering).
+    order = np.lexsort((dup_values.astype(str), -dup_counts))
+
+    return pd.DataFrame(
+        {
+            "Duplicates": dup_values[order],
+            "Instances": dup_counts[order].astype(int),
+        }
+    )
 
 
 def _op_distribution(series: pd.Series) -> pd.DataFrame:
@@ -356,17 +352,22 @@ def _op_distribution(series: pd.Series) -> pd.DataFrame:
     if s.empty:
         return pd.DataFrame(columns=["", "%", "Count"])
 
-    counts = s.value_counts()
+    # Most frequent first, ties broken alphabetically (Report_Housing ordering).
+    # One lexsort over the count arrays replaces value_counts' own sort.
+    # The labels are converted to text once and reordered along with the counts.
+    counts = s.value_counts(sort=False)
+    labels = counts.index.astype(str).to_numpy()
+    order = np.lexsort((labels, -counts.to_numpy()))
+    counts, labels = counts.iloc[order], labels[order]
     percentages = _compute_percentages(counts)
 
-    values = counts.index.astype(str)
-    pct_values = percentages.reindex(counts.index).astype(int)
-
+    # percentages is aligned with counts' order, so no reindex is needed; the
+    # labels are formatted from plain ints rather than via a string Series.
     dist_df = pd.DataFrame(
         {
-            "": values,
-            "%": pct_values.astype(str) + "%",
-            "Count": counts.values,
+            "": labels,
+            "%": [f"{pct}%" for pct in percentages.tolist()],
+            "Count": counts.to_numpy(),
         }
     )
 
@@ -386,10 +387,34 @@ def _op_list_unique_values(series: pd.Series) -> pd.DataFrame:
 
     unique_values = s.unique()
     try:
-        # Try sorting numerically if possible
-        sorted_values = np.sort(unique_values)
+        # Try sorting numerically if possible. Object arrays go through Python's
+        # sort, which specializes the comparison when every value has the same
+        # type (e.g. all str) instead of np.sort's generic per-pair object compare.
+        if unique_values.dtype == object:
+            sorted_values = sorted(unique_values)
+        else:
+            sorted_values = np.sort(unique_values)
     except TypeError:
         # Fallback to string sorting for mixed types
         sorted_values = np.sort(unique_values.astype(str))
 
     return pd.DataFrame(sorted_values, columns=["Unique Value"])
+
+
+# Dispatcher for helper functions, built once at import time rather than per run().
+_OP_HANDLERS = {
+    "average": _op_average,
+    "sum": _op_sum,
+    "median": _op_median,
+    "distribution": _op_distribution,
+    "duplicate_count": _op_duplicate_count,
+    "list_unique_values": _op_list_unique_values,
+}
+
+# Aggregating operations (also the membership test for them) and the label
+# prefix of their metric column.
+_METRIC_LABEL_PREFIXES = {
+    "average": "Average of",
+    "sum": "Sum of",
+    "median": "Median of",
+}
@@ -7,6 +7,23 @@ from .helpers import prepare_data_groups, format_group_name
 logger = logging.getLogger(__name__)
 
 
+def _status_frame(group: str, column: str, message: str, method: str) -> pd.DataFrame:
+    """
+    A one-row result frame carrying a status message instead of an outlier value.
+    """
+    return pd.DataFrame(
+        [
+            {
+                "Group": group,
+                "Original Row Index": pd.NA,
+                "Column": column,
+                "Outlier Value": message,
+                "Method": method.upper(),
+            }
+        ]
+    )
+
+
 def run(
     df: pd.DataFrame, step: schemas.OutlierDetectionAnalysis
 ) -> schemas.ReportBlock:
@@ -18,7 +35,7 @@ def run(
     - Emits explicit rows when there is no numeric data or when no outliers
       are detected for a given column.
     """
-    outlier_records = []
+    outlier_frames: list[pd.DataFrame] = []
 
     data_groups = prepare_data_groups(df, step)
 
@@ -30,14 +47,10 @@ def run(
 
         for col_name in step.target_columns:
             if col_name not in group_df.columns:
-                outlier_records.append(
-                    {
-                        "Group": formatted_group_name,
-                        "Original Row Index": pd.NA,
-                        "Column": col_name,
-                        "Outlier Value": "Column not found",
-                        "Method": step.method.upper(),
-                    }
+                outlier_frames.append(
+                    _status_frame(
+                        formatted_group_name, col_name, "Column not found", step.method
+                    )
                 )
                 continue
 
@@ -46,21 +59,18 @@ def run(
             series = pd.to_numeric(raw_series, errors="coerce").dropna()
 
             if series.empty:
-                outlier_records.append(
-                    {
-                        "Group": formatted_group_name,
-                        "Original Row Index": pd.NA,
-                        "Column": col_name,
-                        "Outlier Value": "No numeric data for analysis",
-                        "Method": step.method.upper(),
-                    }
+                outlier_frames.append(
+                    _status_frame(
+                        formatted_group_name, col_name, "No numeric data for analysis", step.method
+                    )
                 )
                 continue
 
             lower_bound, upper_bound = -np.inf, np.inf
 
             if step.method == "iqr":
-                Q1, Q3 = series.quantile(0.25), series.quantile(0.75)
+                # Both quartiles from one quantile call (one sort) instead of two.
+                Q1, Q3 = series.quantile([0.25, 0.75]).tolist()
                 IQR = Q3 - Q1
                 lower_bound = Q1 - (step.threshold * IQR)
                 upper_bound = Q3 + (step.threshold * IQR)
@@ -72,61 +82,54 @@ def run(
             outliers = series[(series < lower_bound) | (series > upper_bound)]
 
             if outliers.empty:
-                outlier_records.append(
-                    {
-                        "Group": formatted_group_name,
-                        "Original Row Index": pd.NA,
-                        "Column": col_name,
-                        "Outlier Value": "No outliers detected",
-                        "Method": step.method.upper(),
-                    }
+                outlier_frames.append(
+                    _status_frame(
+                        formatted_group_name, col_name, "No outliers detected", step.method
+                    )
                 )
                 continue
 
-            for index, value in outliers.items():
-                outlier_records.append(
+            # One frame per column instead of one dict per outlier row.
+            outlier_frames.append(
+                pd.DataFrame(
                     {
                         "Group": formatted_group_name,
-                        "Original Row Index": index,
+                        "Original Row Index": outliers.index,
                         "Column": col_name,
-                        "Outlier Value": value,
+                        "Outlier Value": outliers.to_numpy(),
                         "Method": step.method.upper(),
                     }
                 )
+            )
 
-    if not outlier_records:
+    if not outlier_frames:
         final_df = pd.DataFrame(
             columns=["Column", "Original Row Index", "Outlier Value", "Method"]
         )
     else:
-        raw_df = pd.DataFrame(outlier_records)
+        raw_df = pd.concat(outlier_frames, ignore_index=True)
 
         if "Group" in raw_df.columns:
             raw_df = raw_df.drop(columns=["Group"])
 
         raw_df = raw_df[["Column", "Original Row Index", "Outlier Value", "Method"]]
 
-        pretty_rows: list[dict] = []
+        pretty_rows: list[tuple] = []
         for col_name, sub in raw_df.groupby("Column", sort=False):
-            pretty_rows.append(
-                {
-                    "Column": col_name,
-                    "Original Row Index": pd.NA,
-                    "Outlier Value": pd.NA,
-                    "Method": "",
-                }
-            )
-
-            for _, r in sub.iterrows():
-                pretty_rows.append(
-                    {
-                        "Column": "",
-                        "Original Row Index": r["Original Row Index"],
-                        "Outlier Value": r["Outlier Value"],
-                        "Method": r["Method"],
-                    }
+            pretty_rows.append((col_name, pd.NA, pd.NA, ""))
+            # Detail rows read column-wise, so no Series is built per outlier row.
+            pretty_rows.extend(
+                zip(
+                    [""] * len(sub),
+                    sub["Original Row Index"].tolist(),
+                    sub["Outlier Value"].tolist(),
+                    sub["Method"].tolist(),
                 )
+            )
 
-        final_df = pd.DataFrame(pretty_rows)
+        final_df = pd.DataFrame(
+            pretty_rows,
+            columns=["Column", "Original Row Index", "Outlier Value", "Method"],
+        )
 
     return schemas.ReportBlock(title=step.output_name, data=final_df)
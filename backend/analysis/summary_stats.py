@@ -7,13 +7,15 @@ from .helpers import prepare_data_groups, format_group_name, apply_transformatio
 
 logger = logging.getLogger(__name__)
 
-ALLOWED_TRANSFORMATIONS = {
-    "to_numeric",
-    "fill_na",
-    "split_and_explode",
-    "strip_whitespace",
-    "to_root_node",
-}
+ALLOWED_TRANSFORMATIONS = frozenset(
+    {
+        "to_numeric",
+        "fill_na",
+        "split_and_explode",
+        "strip_whitespace",
+        "to_root_node",
+    }
+)
 
 
 def _validate_transformations(
@@ -45,6 +47,17 @@ def run(df: pd.DataFrame, step: schemas.SummaryStatsAnalysis) -> schemas.ReportB
     # --- Validate transformations before starting ---
     _validate_transformations(step.column_transformations)
 
+    # Column name -> (its transformations, whether they explode rows), resolved once
+    # instead of scanning the specs for every (group, column). The first spec for a
+    # column wins.
+    transformations_by_column: dict[str, tuple[list, bool]] = {}
+    for ct in step.column_transformations or []:
+        if ct.column_name not in transformations_by_column:
+            transformations_by_column[ct.column_name] = (
+                ct.transformations,
+                any(t.action == "split_and_explode" for t in ct.transformations),
+            )
+
     try:
         data_groups = prepare_data_groups(df, step)
     except ValueError as e:
@@ -99,30 +112,22 @@ def run(df: pd.DataFrame, step: schemas.SummaryStatsAnalysis) -> schemas.ReportB
                 continue
 
             try:
-                series_to_transform = group_df[col_name].copy()
-
-                col_trans_details = next(
-                    (
-                        ct
-                        for ct in (step.column_transformations or [])
-                        if ct.column_name == col_name
-                    ),
-                    None,
+                # Read-only here: apply_transformations copies before mutating and
+                # every later step (explode, to_numeric, dropna) returns a new series.
+                series_to_transform = group_df[col_name]
+
+                col_transformations, has_split_and_explode = (
+                    transformations_by_column.get(col_name, ([], False))
                 )
 
                 transformed_series = series_to_transform
-                has_split_and_explode = False
 
-                if col_trans_details:
+                if col_transformations:
                     transformed_series = apply_transformations(
                         series_to_transform,
-                        col_trans_details.transformations,
+                        col_transformations,
                         [],
                     )
-                    has_split_and_explode = any(
-                        t.action == "split_and_explode"
-                        for t in col_trans_details.transformations
-                    )
 
                 # Handle explode if requested
                 series_for_stats = transformed_series
@@ -221,26 +226,17 @@ def run(df: pd.DataFrame, step: schemas.SummaryStatsAnalysis) -> schemas.ReportB
 
         raw_df = raw_df[["Column", "Metric", "Value"]]
 
-        pretty_rows: list[dict] = []
+        pretty_rows: list[tuple] = []
         for col_name, sub in raw_df.groupby("Column", sort=False):
             # Header row for this numeric column
-            pretty_rows.append(
-                {
-                    "Column": col_name,
-                    "Metric": "",
-                    "Value": "",
-                }
+            pretty_rows.append((col_name, "", ""))
+            # Detail rows: each metric/value pair with a blank Column cell, read
+            # column-wise in one extend instead of a Series per row via iterrows.
+            pretty_rows.extend(
+                ("", metric, value)
+                for metric, value in zip(sub["Metric"].tolist(), sub["Value"].tolist())
             )
-            # Detail rows: each metric/value pair with a blank Column cell
-            for _, r in sub.iterrows():
-                pretty_rows.append(
-                    {
-                        "Column": "",
-                        "Metric": r["Metric"],
-                        "Value": r["Value"],
-                    }
-                )
 
-        final_df = pd.DataFrame(pretty_rows)
+        final_df = pd.DataFrame(pretty_rows, columns=["Column", "Metric", "Value"])
 
     return schemas.ReportBlock(title=step.output_name, data=final_df)
@@ -49,13 +49,12 @@ def run(df: pd.DataFrame, step: schemas.TimeSeriesAnalysis) -> schemas.ReportBlo
             continue
 
         formatted_group_name = format_group_name(group_name)
-        working_df = group_df.copy()
 
         # Check required columns
         missing_cols: list[str] = []
-        if step.date_column not in working_df.columns:
+        if step.date_column not in group_df.columns:
             missing_cols.append(step.date_column)
-        if step.metric_column not in working_df.columns:
+        if step.metric_column not in group_df.columns:
             missing_cols.append(step.metric_column)
 
         if missing_cols:
@@ -76,12 +75,17 @@ def run(df: pd.DataFrame, step: schemas.TimeSeriesAnalysis) -> schemas.ReportBlo
             continue
 
         try:
-            # Convert types robustly
-            working_df[step.date_column] = pd.to_datetime(
-                working_df[step.date_column], errors="coerce"
-            )
-            working_df[step.metric_column] = pd.to_numeric(
-                working_df[step.metric_column], errors="coerce"
+            # Convert types robustly. Only the two columns the resample needs are
+            # converted into a new frame; the rest of the group is never copied.
+            working_df = pd.DataFrame(
+                {
+                    step.date_column: pd.to_datetime(
+                        group_df[step.date_column], errors="coerce"
+                    ),
+                    step.metric_column: pd.to_numeric(
+                        group_df[step.metric_column], errors="coerce"
+                    ),
+                }
             )
 
             # Drop rows where date or metric conversion failed
@@ -196,25 +200,19 @@ def run(df: pd.DataFrame, step: schemas.TimeSeriesAnalysis) -> schemas.ReportBlo
                 exc_info=True,
             )
 
-        pretty_rows: list[dict] = []
-
-        # One header row followed by all data points.
-        pretty_rows.append(
+        # One header row followed by all data points. The data rows are built
+        # column-wise from raw_df rather than one dict per row.
+        header_row = pd.DataFrame(
+            {"Column": [metric_label], "Timestamp": [""], "Value": [""]}
+        )
+        data_rows = pd.DataFrame(
             {
-                "Column": metric_label,
-                "Timestamp": "",
-                "Value": "",
+                "Column": "",
+                "Timestamp": raw_df["Timestamp"].to_numpy(),
+                "Value": raw_df["Value"].to_numpy(),
             }
         )
-        for _, r in raw_df.iterrows():
-            pretty_rows.append(
-                {
-                    "Column": "",
-                    "Timestamp": r["Timestamp"],
-                    "Value": r["Value"],
-                }
-            )
 
-        final_df = pd.DataFrame(pretty_rows)
+        final_df = pd.concat([header_row, data_rows], ignore_index=True)
 
     return schemas.ReportBlock(title=step.output_name, data=final_df)
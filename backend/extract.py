@@ -1,16 +1,20 @@
 import re
 import csv
+import functools
 import pandas as pd
 from typing import IO, Any
 
-# Pre-compiled patterns used by _normalize_column_name — compiled once at import time.
-_RE_WHITESPACE = re.compile(r"\s+")
-_RE_NON_WORD = re.compile(r"[^\w]+")
-_RE_MULTI_UNDERSCORE = re.compile(r"_+")
+# Pre-compiled pattern used by _normalize_column_name — compiled once at import time.
+# Any run of non-word characters and/or underscores collapses to a single "_".
+_RE_SEPARATOR_RUN = re.compile(r"[\W_]+")
 
 # Define specific pandas errors to catch
 from pandas.errors import ParserError, EmptyDataError
 
+# How much of the file to inspect when sniffing the delimiter.
+_SNIFF_SAMPLE_BYTES = 64 * 1024
+_SNIFF_DELIMITERS = ",;\t|"
+
 CUSTOM_NA_VALUES = [
     "",  # Empty string
     "#N/A",  # Excel's Not Available
@@ -42,14 +46,12 @@ def _normalize_column_name(name: str) -> str:
     - lowercase
     - replace non-alphanumeric characters with underscores
     - collapse multiple underscores and trim them from the ends
+
+    All of the above is done with a single regex pass: whitespace, punctuation and
+    existing underscores are all separators, so one substitution of separator runs
+    covers the strip/collapse/replace steps.
     """
-    name = str(name).strip()
-    name = _RE_WHITESPACE.sub(" ", name)
-    name = name.lower()
-    name = _RE_NON_WORD.sub("_", name)
-    name = _RE_MULTI_UNDERSCORE.sub("_", name)
-    name = name.strip("_")
-    return name
+    return _RE_SEPARATOR_RUN.sub("_", str(name).lower()).strip("_")
 
 
 def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
@@ -59,20 +61,58 @@ def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
     (not a Series). Downstream string ops like `.str.strip()` then fail.
 
     We de-duplicate by appending a numeric suffix: col, col_2, col_3, ...
+
+    Only the labels change, so a shallow copy is enough: the column data is shared
+    with the input instead of being duplicated.
     """
-    df = df.copy()
+    df = df.copy(deep=False)
+    df.columns = list(_normalized_header_names(tuple(df.columns)))
+    return df
 
-    normalized = [_normalize_column_name(col) for col in df.columns]
 
+@functools.lru_cache(maxsize=128)
+def _normalized_header_names(columns: tuple) -> tuple[str, ...]:
+    """
+    Normalized, de-duplicated names for a tuple of raw headers.
+
+    Cached by the raw header tuple: uploads of the same export (and repeated
+    header reads of one file) share a layout, so the work is done once per layout.
+    """
     seen: dict[str, int] = {}
     unique_cols: list[str] = []
-    for name in normalized:
-        base = name or "column"
+    for col in columns:
+        base = _normalize_column_name(col) or "column"
         count = seen.get(base, 0) + 1
         seen[base] = count
         unique_cols.append(base if count == 1 else f"{base}_{count}")
 
-    df.columns = unique_cols
+    return tuple(unique_cols)
+
+
+def _strip_blank_to_na(series: pd.Series) -> pd.Series:
+    """
+    Trim whitespace and turn cells that end up empty into NaN in one pass.
+
+    read_csv only treats exactly-empty fields as missing, so whitespace-only cells
+    would otherwise survive as "" values. A single length check after the strip
+    finds both blanks and missing cells, so no regex or extra passes are needed.
+    """
+    stripped = series.str.strip()
+    # Missing cells have no length, so the comparison is False for them as well.
+    return stripped.where(stripped.str.len() > 0)
+
+
+def _clean_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Trim whitespace ONLY from object/string columns without destroying other types,
+    and mark blank cells as missing while we are already walking the column.
+    """
+    # Address columns by position: duplicate column names then need no special
+    # case (df[col] would return a DataFrame), and no DataFrame.apply is involved.
+    for pos, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            df.isetitem(pos, _strip_blank_to_na(df.iloc[:, pos]))
+
     return df
 
 
@@ -81,18 +121,65 @@ def _clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     Internal helper to apply standard, non-destructive cleaning to a DataFrame.
     """
     df = _normalize_headers(df)
+    return _clean_string_columns(df)
 
-    # Correctly trim whitespace ONLY from object/string columns without destroying other types.
-    # If duplicate column names exist, df[col] returns a DataFrame; handle that safely.
-    for col in df.select_dtypes(include=["object"]).columns:
-        value = df[col]
-        if isinstance(value, pd.DataFrame):
-            # Multiple columns share the same name; trim each sub-column.
-            df[col] = value.apply(lambda s: s.str.strip())
-        else:
-            df[col] = value.str.strip()
 
-    return df
+def _sniff_delimiter(file_object: IO[Any]) -> str | None:
+    """
+    Detect the CSV delimiter from the head of the file and rewind it.
+
+    Returns None when the stream cannot be rewound or no delimiter can be
+    determined, in which case the caller falls back to pandas' own sniffing.
+    """
+    try:
+        start = file_object.tell()
+        sample = file_object.read(_SNIFF_SAMPLE_BYTES)
+        file_object.seek(start)
+    except (AttributeError, OSError):
+        return None
+
+    if isinstance(sample, bytes):
+        sample = sample.decode("utf-8", errors="ignore")
+
+    # Only sniff complete lines so a truncated last row does not skew the result.
+    if "\n" in sample:
+        sample = sample.rsplit("\n", 1)[0]
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return None
+
+
+def _read_csv(file_object: IO[Any]) -> pd.DataFrame:
+    """
+    Read a CSV with the C parser whenever possible.
+
+    The python engine is only needed for its delimiter sniffing (sep=None); when the
+    delimiter can be detected up front we hand the file to the C parser instead
+    (same type inference, much faster), and fall back to the python engine if the
+    C parser rejects the file.
+    """
+    read_kwargs = dict(
+        # Keep CSV quoting enabled (default). Disabling quoting (QUOTE_NONE)
+        # often *creates* "Expected N fields, saw M" when delimiters exist
+        # inside quoted text fields.
+        on_bad_lines="warn",
+        keep_default_na=False,
+        na_values=CUSTOM_NA_VALUES,
+        quotechar='"',
+        doublequote=True,
+    )
+
+    delimiter = _sniff_delimiter(file_object)
+    if delimiter is not None:
+        start = file_object.tell()
+        try:
+            return pd.read_csv(file_object, sep=delimiter, engine="c", **read_kwargs)
+        except ParserError:
+            file_object.seek(start)
+
+    return pd.read_csv(file_object, sep=None, engine="python", **read_kwargs)
 
 
 def load_tabular_data(file_object: IO[Any], filename: str) -> pd.DataFrame:
@@ -105,21 +192,7 @@ def load_tabular_data(file_object: IO[Any], filename: str) -> pd.DataFrame:
     try:
         if filename_lower.endswith(".csv"):
             # Let pandas infer dtypes, don't force everything to string.
-            # In extract.py, inside load_tabular_data, right before pd.read_csv/excel
-
-            df = pd.read_csv(
-                file_object,
-                # Keep CSV quoting enabled (default). Disabling quoting (QUOTE_NONE)
-                # often *creates* "Expected N fields, saw M" when delimiters exist
-                # inside quoted text fields.
-                sep=None,
-                engine="python",
-                on_bad_lines="warn",
-                keep_default_na=False,
-                na_values=CUSTOM_NA_VALUES,
-                quotechar='"',
-                doublequote=True,
-            )
+            df = _read_csv(file_object)
 
         elif filename_lower.endswith((".xlsx", ".xls")):
             df = pd.read_excel(file_object, na_values=CUSTOM_NA_VALUES)
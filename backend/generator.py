@@ -1,25 +1,42 @@
+import csv
+import io
+from typing import Iterable, Sequence
+
 import pandas as pd
 
 # Characters that spreadsheet applications (Excel, Google Sheets, LibreOffice Calc)
 # interpret as formula prefixes, enabling CSV injection.
 _FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
-
-def _sanitize_cell(value: object) -> object:
-    """
-    Prefix string values that start with a formula character with a single-quote
-    so spreadsheets render them as plain text instead of executing them as formulas.
-    """
-    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
-        return "'" + value
-    return value
+# Rows pandas formats per batch when writing CSV, bounding the intermediate
+# buffers for very large result frames.
+_CSV_CHUNK_ROWS = 100_000
 
 
 def _sanitize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Return a copy of *df* with all string cells sanitized against CSV injection."""
-    sanitized = df.copy()
-    for col in sanitized.select_dtypes(include="object").columns:
-        sanitized[col] = sanitized[col].map(_sanitize_cell)
+    """
+    Return *df* with all string cells sanitized against CSV injection.
+
+    Only object columns can hold strings, so frames without any are returned
+    untouched, and the copy is made only once a cell actually needs escaping.
+    """
+    sanitized = df
+    # Address columns by position so duplicate column names stay Series-shaped.
+    for pos, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        values = df.iloc[:, pos]
+        try:
+            # Non-string cells yield NA from .str and are treated as "no prefix".
+            needs_escape = values.str.startswith(_FORMULA_PREFIXES, na=False)
+        except AttributeError:
+            # .str refuses object columns without any strings: nothing to escape.
+            continue
+        needs_escape = needs_escape.to_numpy()
+        if needs_escape.any():
+            if sanitized is df:
+                sanitized = df.copy()
+            sanitized.iloc[needs_escape, pos] = "'" + values[needs_escape]
     return sanitized
 
 
@@ -30,4 +47,34 @@ def to_csv_string(df: pd.DataFrame, header: bool = False) -> str:
     String values starting with formula-prefix characters are escaped so they
     cannot be executed as spreadsheet formulas (CSV injection prevention).
     """
-    return _sanitize_dataframe(df).to_csv(index=False, header=header)
+    return _sanitize_dataframe(df).to_csv(
+        index=False,
+        header=header,
+        chunksize=_CSV_CHUNK_ROWS,
+        lineterminator="\n",
+    )
+
+
+def rows_to_csv_string(rows: Iterable[Sequence[object]]) -> str:
+    """
+    Writes already-assembled rows straight to a CSV formatted string.
+
+    Produces the same text as building a DataFrame from `rows` and calling
+    to_csv_string(df, header=False), without materializing the DataFrame.
+    Cells are sanitized against CSV injection the same way: string values that
+    start with a formula character get a single-quote prefix. The check is inlined
+    so non-string cells cost one isinstance test and no extra function call.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    prefixes = _FORMULA_PREFIXES
+    writer.writerows(
+        [
+            "'" + value
+            if isinstance(value, str) and value.startswith(prefixes)
+            else value
+            for value in row
+        ]
+        for row in rows
+    )
+    return buf.getvalue()
@@ -27,33 +27,41 @@ ANALYSIS_HANDLERS = {
 }
 
 
+def _run_step(df: pd.DataFrame, step: schemas.AnalysisJob) -> schemas.ReportBlock:
+    """
+    Runs a single analysis step, converting failures into an error ReportBlock.
+    """
+    try:
+        handler = ANALYSIS_HANDLERS.get(step.type)
+        if handler:
+            return handler(df, step)
+
+        error_df = pd.DataFrame([{"Error": f"Unknown analysis type: '{step.type}'"}])
+        return schemas.ReportBlock(
+            title=f"Error in step: {step.output_name}", data=error_df
+        )
+
+    except Exception as e:
+        logger.error(
+            "Error processing step '%s': %s", step.output_name, e, exc_info=True
+        )
+
+        error_df = pd.DataFrame(
+            [{"Error": "An unexpected error occurred during this analysis step."}]
+        )
+        return schemas.ReportBlock(
+            title=f"Error in step: {step.output_name}", data=error_df
+        )
+
+
 def run_dynamic_analysis(
     df: pd.DataFrame, request: schemas.AnalysisRequest
 ) -> Generator[schemas.ReportBlock, None, None]:
     """
     A generator that calculates and YIELDS each analysis block one by one.
+
+    Steps run sequentially, so only the current step's intermediate frames are
+    alive at a time.
     """
     for step in request.analysis_steps:
-        try:
-            handler = ANALYSIS_HANDLERS.get(step.type)
-            if handler:
-                yield handler(df, step)
-            else:
-                error_df = pd.DataFrame(
-                    [{"Error": f"Unknown analysis type: '{step.type}'"}]
-                )
-                yield schemas.ReportBlock(
-                    title=f"Error in step: {step.output_name}", data=error_df
-                )
-
-        except Exception as e:
-            logger.error(
-                "Error processing step '%s': %s", step.output_name, e, exc_info=True
-            )
-
-            error_df = pd.DataFrame(
-                [{"Error": "An unexpected error occurred during this analysis step."}]
-            )
-            yield schemas.ReportBlock(
-                title=f"Error in step: {step.output_name}", data=error_df
-            )
+        yield _run_step(df, step)
@@ -4,17 +4,22 @@ from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 from fastapi.responses import StreamingResponse, Response, PlainTextResponse
 from utils.definitions import get_all_definitions_as_text
 from pydantic import ValidationError
+import functools
 import json
+import operator
+import os
+import re
 import urllib.parse
 import pandas as pd
 import logging
 from io import BytesIO
 import zipfile
+from typing import Sequence
 
 import schemas
 from extract import load_tabular_data
 from orchestrator import run_dynamic_analysis
-from generator import to_csv_string
+from generator import to_csv_string, rows_to_csv_string
 from database import get_db
 from models import ReportRun, RunStepResult, RunArtifact
 from sqlalchemy.orm import Session, selectinload
@@ -24,6 +29,14 @@ router = APIRouter()
 # 200 MB — raised to support larger real-world datasets.
 MAX_UPLOAD_BYTES = 200 * 1024 * 1024
 
+# Keywords that route a block to the insights file ("correlation", "crosstab",
+# "cross-tab"), matched in a single scan of the lowercased title.
+_RE_INSIGHT_TITLE = re.compile(r"correlation|cross-?tab")
+
+# Sort keys for run details (C-level attribute lookups rather than lambdas).
+_BY_STEP_INDEX = operator.attrgetter("step_index")
+_BY_CREATED_AT = operator.attrgetter("created_at")
+
 
 @router.get("/runs/", tags=["Reports"])
 def list_report_runs(
@@ -80,8 +93,8 @@ def get_report_run(run_id: str, db: Session = Depends(get_db)):
     if run is None:
         raise HTTPException(status_code=404, detail="Run not found.")
 
-    step_results = sorted(run.step_results, key=lambda item: item.step_index)
-    artifacts = sorted(run.artifacts, key=lambda item: item.created_at)
+    step_results = sorted(run.step_results, key=_BY_STEP_INDEX)
+    artifacts = sorted(run.artifacts, key=_BY_CREATED_AT)
 
     return {
         "id": run.id,
@@ -129,24 +142,36 @@ def get_report_run(run_id: str, db: Session = Depends(get_db)):
         ],
     }
 
+
+# Separators between a block title's column part and its operation part, in the
+# order they are tried. Built once at import time rather than on every call.
+_TITLE_SEPARATORS = ("—", "-")
+
+
+# Both title helpers are pure functions of the block title, and recipes reuse the
+# same output names from run to run, so their results are memoized.
+@functools.lru_cache(maxsize=256)
 def _format_block_header(title: str) -> str:
     """
     - Uppercases and replaces space with _
     """
-    for sep in ["—", "-"]:
-        if sep in title:
-            title = title.split(sep, 1)[0]
+    for sep in _TITLE_SEPARATORS:
+        # partition finds and splits in one scan (vs. an "in" test, then split).
+        head, found, _ = title.partition(sep)
+        if found:
+            title = head
             break
     base = title.strip().replace("_", " ")
     return base.upper()
 
 
+@functools.lru_cache(maxsize=256)
 def _extract_operation_label(title: str) -> str:
     op = "result"
 
-    for sep in ["—", "-"]:
-        if sep in title:
-            right = title.split(sep, 1)[1]
+    for sep in _TITLE_SEPARATORS:
+        _, found, right = title.partition(sep)
+        if found:
             op = right.strip().lower()
             break
     else:
@@ -172,6 +197,14 @@ _COLS_AVERAGE = ["Average"]
 _COLS_SUM = ["Sum"]
 _COLS_MEDIAN = ["Median"]
 
+# Fixed section text of the rendered CSVs, formatted once at import.
+_NO_DATA_LINE = "(No data produced for this analysis)\n"
+_CROSSTABS_OUTPUT_LINE = rows_to_csv_string([["Crosstabs_Output"]])
+_CORRELATION_HEADER_ROWS = (
+    ("Correlation_Results", "", ""),
+    ("Source Column", "Target Column", "Correlation"),
+)
+
 
 def _format_single_block(block: schemas.ReportBlock, is_first: bool) -> str:
     parts: list[str] = []
@@ -192,44 +225,40 @@ def _format_single_block(block: schemas.ReportBlock, is_first: bool) -> str:
             # Single header row: column name + operation + metric labels.
             rows.append([f"{hdr} — {op_label}", "%", "Count"])
 
-            for _, row in data.iterrows():
-                rows.append(
-                    [
-                        str(row.iloc[0]),
-                        str(row.iloc[1]),
-                        str(row.iloc[2]),
-                    ]
-                )
+            # Read each column once instead of building a Series per row.
+            values, pcts, counts = (data.iloc[:, i].tolist() for i in range(3))
+            rows.extend(
+                [str(value), str(pct), str(count)]
+                for value, pct, count in zip(values, pcts, counts)
+            )
 
         elif cols == _COLS_DUPLICATE:
             # Single header row: column name + operation + metric labels.
             rows.append([f"{hdr} — {op_label}", "Duplicates", "Instances"])
-            for _, row in data.iterrows():
-                rows.append(
-                    [
-                        "",
-                        str(row["Duplicates"]),
-                        str(int(row["Instances"])),
-                    ]
+            rows.extend(
+                ["", str(value), str(int(instances))]
+                for value, instances in zip(
+                    data["Duplicates"].tolist(), data["Instances"].tolist()
                 )
+            )
 
         elif cols in (_COLS_AVERAGE, _COLS_SUM, _COLS_MEDIAN):
             metric_label = cols[0]
             rows.append([f"{hdr} — {op_label}", "", metric_label])
-            for _, row in data.iterrows():
-                rows.append(["", "", str(row[metric_label])])
+            rows.extend(["", "", str(value)] for value in data[metric_label].tolist())
 
         else:
             padded_cols = cols[:3] + [""] * max(0, 3 - len(cols))
             metric_label = padded_cols[-1] or "Value"
             rows.append([f"{hdr} — {op_label}", "", metric_label])
-            for _, row in data.iterrows():
-                vals = [str(v) for v in list(row.values)[:3]]
-                vals = vals + [""] * max(0, 3 - len(vals))
-                rows.append(vals)
+            # Rows of the frame's common-dtype array (what iterrows yields) without
+            # building a Series per row; every row shares the same padding.
+            padding = [""] * max(0, 3 - len(cols))
+            rows.extend(
+                [str(v) for v in values[:3]] + padding for values in data.to_numpy()
+            )
 
-        tmp_df = pd.DataFrame(rows)
-        parts.append(to_csv_string(tmp_df, header=False))
+        parts.append(rows_to_csv_string(rows))
 
     else:
         # Rich blocks (e.g., correlations, crosstabs) – keep title row + full table.
@@ -237,7 +266,7 @@ def _format_single_block(block: schemas.ReportBlock, is_first: bool) -> str:
         if not data.empty:
             parts.append(to_csv_string(data, header=True))
         else:
-            parts.append("(No data produced for this analysis)\n")
+            parts.append(_NO_DATA_LINE)
 
     return "".join(parts)
 
@@ -250,12 +279,12 @@ def _render_category(blocks: list[schemas.ReportBlock]) -> str:
     if not blocks:
         return ""
 
-    parts: list[str] = []
-    first = True
-    for block in blocks:
-        parts.append(_format_single_block(block, is_first=first))
-        first = False
-    return "".join(parts)
+    return "".join(
+        [
+            _format_single_block(block, is_first=index == 0)
+            for index, block in enumerate(blocks)
+        ]
+    )
 
 
 
@@ -285,12 +314,12 @@ def _render_insights(blocks: list[schemas.ReportBlock]) -> str:
 
     # 1) Crosstab section
     if xtab_blocks:
-        xtab_header_df = pd.DataFrame([["Crosstabs_Output"]])
-        parts.append(to_csv_string(xtab_header_df, header=False))
+        parts.append(_CROSSTABS_OUTPUT_LINE)
 
         first_xtab = True
         for block in xtab_blocks:
-            data = block.data.copy()
+            # Only non-mutating drops and filters below, so no defensive copy.
+            data = block.data
 
             if "Group" in data.columns:
                 data = data.drop(columns=["Group"])
@@ -308,8 +337,7 @@ def _render_insights(blocks: list[schemas.ReportBlock]) -> str:
             parts.append("\n" if first_xtab else "\n\n")
             first_xtab = False
 
-            title_df = pd.DataFrame([[f"=== {block.title} ==="]])
-            parts.append(to_csv_string(title_df, header=False))
+            parts.append(rows_to_csv_string([[f"=== {block.title} ==="]]))
 
             parts.append("\n")
             parts.append(to_csv_string(data, header=True))
@@ -329,29 +357,30 @@ def _render_insights(blocks: list[schemas.ReportBlock]) -> str:
                 "Column 2",
                 "Correlation Value",
             }.issubset(all_corr.columns):
-                corr_df = all_corr[["Column 1", "Column 2", "Correlation Value"]].copy()
-                corr_df.rename(
+                # The selection is already a new frame; rename it directly rather
+                # than copying it first and renaming in place.
+                corr_df = all_corr[["Column 1", "Column 2", "Correlation Value"]].rename(
                     columns={
                         "Column 1": "Source Column",
                         "Column 2": "Target Column",
                         "Correlation Value": "Correlation",
-                    },
-                    inplace=True,
+                    }
                 )
 
                 corr_df["Correlation"] = corr_df["Correlation"].astype(float).round(4)
 
-                header_rows = pd.DataFrame(
-                    [
-                        ["Correlation_Results", "", ""],
-                        ["Source Column", "Target Column", "Correlation"],
-                    ],
-                    columns=["Source Column", "Target Column", "Correlation"],
+                # Header rows and the table go straight to the CSV writer as plain
+                # row lists, instead of being concatenated into one object frame.
+                rows: list[Sequence] = list(_CORRELATION_HEADER_ROWS)
+                rows.extend(
+                    zip(
+                        corr_df["Source Column"].tolist(),
+                        corr_df["Target Column"].tolist(),
+                        corr_df["Correlation"].tolist(),
+                    )
                 )
 
-                corr_with_header = pd.concat([header_rows, corr_df], ignore_index=True)
-
-                parts.append(to_csv_string(corr_with_header, header=False))
+                parts.append(rows_to_csv_string(rows))
 
     return "".join(parts)
 
@@ -372,6 +401,8 @@ def _build_export_title_csv(output_filename: str, run_id: str) -> str:
     Build a top-of-sheet metadata row so the generated spreadsheet clearly shows
     the logical output title and the run id that produced it.
     """
+    # output_filename is free text rather than a path: only a trailing extension
+    # is dropped, so "Sales 3/2024.xlsx" keeps its slash.
     base_title = output_filename or "generated_report"
     if "." in base_title:
         base_title = base_title.rsplit(".", 1)[0]
@@ -379,8 +410,7 @@ def _build_export_title_csv(output_filename: str, run_id: str) -> str:
     # Clean it up for display.
     display_title = base_title.replace("_", " ").strip()
 
-    title_df = pd.DataFrame([[display_title, f"Run ID: {run_id}"]])
-    return to_csv_string(title_df, header=False) + "\n"
+    return rows_to_csv_string([[display_title, f"Run ID: {run_id}"]]) + "\n"
 
 
 def get_analysis_request(
@@ -425,21 +455,25 @@ async def extract_headers(file: UploadFile = File(...)):
     filename = file.filename or ""
 
     try:
-        raw = await file.read()
-
-        if len(raw) > MAX_UPLOAD_BYTES:
+        # Measure the spooled upload instead of reading it all into memory: only
+        # the header row is parsed, straight from the underlying file.
+        buffer = file.file
+        buffer.seek(0, os.SEEK_END)
+        size = buffer.tell()
+        buffer.seek(0)
+
+        if size > MAX_UPLOAD_BYTES:
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum allowed size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.",
             )
 
-        buffer = BytesIO(raw)
-
         lowered = filename.lower()
+        # Only the header row is needed; dtype=str skips type inference entirely.
         if lowered.endswith(".csv"):
-            df = pd.read_csv(buffer, nrows=0)
+            df = pd.read_csv(buffer, nrows=0, dtype=str)
         elif lowered.endswith((".xls", ".xlsx")):
-            df = pd.read_excel(buffer, nrows=0)
+            df = pd.read_excel(buffer, nrows=0, dtype=str)
         else:
             raise HTTPException(
                 status_code=400,
@@ -502,11 +536,7 @@ async def generate_report_endpoint(
             step = request_data.analysis_steps[index - 1]
             is_error_block = title_lower.startswith("error in step:")
 
-            if (
-                "correlation" in title_lower
-                or "crosstab" in title_lower
-                or "cross-tab" in title_lower
-            ):
+            if _RE_INSIGHT_TITLE.search(title_lower):
                 insight_blocks.append(block)
             else:
                 report_blocks.append(block)
@@ -565,11 +595,13 @@ async def generate_report_endpoint(
         report_csv_name = _build_run_scoped_filename("report.csv", run.id)
         insights_csv_name = _build_run_scoped_filename("insights.csv", run.id)
 
-        # Build ZIP in memory.
+        # Build ZIP in memory. Each CSV is encoded once and the same bytes are
+        # both compressed into the archive and measured for the artifact record.
         zip_buf = BytesIO()
         with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
             if report_csv:
-                zf.writestr(report_csv_name, report_csv)
+                report_bytes = report_csv.encode("utf-8")
+                zf.writestr(report_csv_name, report_bytes)
                 db.add(
                     RunArtifact(
                         run_id=run.id,
@@ -577,11 +609,12 @@ async def generate_report_endpoint(
                         file_name=report_csv_name,
                         file_path=None,
                         content_type="text/csv",
-                        size_bytes=len(report_csv.encode("utf-8")),
+                        size_bytes=len(report_bytes),
                     )
                 )
             if insights_csv:
-                zf.writestr(insights_csv_name, insights_csv)
+                insights_bytes = insights_csv.encode("utf-8")
+                zf.writestr(insights_csv_name, insights_bytes)
                 db.add(
                     RunArtifact(
                         run_id=run.id,
@@ -589,12 +622,11 @@ async def generate_report_endpoint(
                         file_name=insights_csv_name,
                         file_path=None,
                         content_type="text/csv",
-                        size_bytes=len(insights_csv.encode("utf-8")),
+                        size_bytes=len(insights_bytes),
                     )
                 )
 
-        zip_buf.seek(0)
-        zip_bytes = zip_buf.getvalue()
+        zip_size = zip_buf.getbuffer().nbytes
 
         # Derive zip filename from requested output_filename and scope it to the run id.
         out_name = request_data.output_filename or "generated_report.zip"
@@ -612,7 +644,7 @@ async def generate_report_endpoint(
                 file_name=out_name,
                 file_path=None,
                 content_type="application/zip",
-                size_bytes=len(zip_bytes),
+                size_bytes=zip_size,
             )
         )
 
@@ -627,7 +659,8 @@ async def generate_report_endpoint(
         run.output_filename = out_name
         db.commit()
 
-        zip_buf = BytesIO(zip_bytes)
+        # Stream the archive straight from the buffer it was written into.
+        zip_buf.seek(0)
         return StreamingResponse(
             zip_buf,
             media_type="application/zip",
@@ -6,6 +6,7 @@ import numpy as np
 
 # Import the function and schemas to be tested
 from backend.analysis.correlation import run
+from backend.analysis.helpers import cramers_v
 from backend.schemas import CorrelationAnalysis, Filter, ReportBlock
 
 
@@ -169,3 +170,17 @@ def test_correlation_no_overlapping_data():
 
     # No overlapping data after dropping NaNs and aligning, so the result should be empty.
     assert result.data.empty
+
+
+def test_cramers_v_matches_crosstab_and_ignores_incomplete_pairs():
+    """Tests that Cramér's V equals the crosstab-based value and skips pairs with a missing side."""
+    from scipy.stats import chi2_contingency
+
+    x = pd.Series(["a", "a", "b", "b", "c", "c", "a", None])
+    y = pd.Series(["p", "q", "p", "p", "q", "q", "p", "q"])
+
+    table = pd.crosstab(x, y)
+    chi2, _, _, _ = chi2_contingency(table, correction=False)
+    expected = np.sqrt(chi2 / table.to_numpy().sum() / (min(table.shape) - 1))
+
+    assert cramers_v(x, y) == pytest.approx(expected)
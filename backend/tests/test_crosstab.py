@@ -4,7 +4,7 @@ import pytest
 import pandas as pd
 
 # Import the function and schemas to be tested
-from backend.analysis.crosstab import run
+from backend.analysis.crosstab import run, _crosstab_counts
 from backend.schemas import (
     CrosstabAnalysis,
     Filter,
@@ -175,3 +175,13 @@ def test_crosstab_filter_yields_no_data(sample_df):
     # The resulting dataframe should be empty but have the correct placeholder columns
     assert result.data.empty
     assert list(result.data.columns) == ["Group", "Data"]
+
+
+def test_crosstab_counts_matches_pandas_crosstab(sample_df):
+    """Tests that the bincount table matches pd.crosstab with margins, labels included."""
+    index = sample_df["region"]
+    columns = sample_df["product"]
+
+    pd.testing.assert_frame_equal(
+        _crosstab_counts(index, columns), pd.crosstab(index, columns, margins=True)
+    )
@@ -73,6 +73,15 @@ def test_op_duplicate_count_no_duplicates():
     assert result_df.loc[result_df["Metric"] == "Duplicate Count", "Value"].iloc[0] == 0
 
 
+def test_op_duplicate_count_orders_by_count_then_value():
+    """Tests that duplicates are listed most frequent first, ties alphabetically."""
+    series = pd.Series(["pear", "fig", "pear", "fig", "kiwi", "kiwi", "kiwi", "plum", None])
+    result_df = _op_duplicate_count(series)
+
+    assert result_df["Duplicates"].tolist() == ["kiwi", "fig", "pear"]
+    assert result_df["Instances"].tolist() == [3, 2, 2]
+
+
 # ==============================================================================
 # 3. Tests for _op_distribution
 # ==============================================================================
@@ -104,6 +113,16 @@ def test_op_distribution_simple():
     assert len(result_df) == 4
 
 
+def test_op_distribution_breaks_remainder_ties_by_label():
+    """Tests that equal fractional parts award the leftover point alphabetically."""
+    # 5b, 2c, 1a: b and a both sit at x.5 of a point, and "a" sorts first.
+    series = pd.Series(["b"] * 5 + ["c"] * 2 + ["a"])
+    result_df = _op_distribution(series)
+
+    assert result_df[""].tolist() == ["b", "c", "a"]
+    assert result_df["%"].tolist() == ["62%", "25%", "13%"]
+
+
 # ==============================================================================
 # 4. Tests for _op_list_unique_values
 # ==============================================================================
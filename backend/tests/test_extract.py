@@ -0,0 +1,63 @@
+# tests/test_extract.py
+
+import io
+
+import pandas as pd
+
+from backend.extract import load_tabular_data, _sniff_delimiter
+
+
+# ==============================================================================
+# 1. Delimiter detection
+# ==============================================================================
+
+
+def test_sniff_delimiter_detects_and_rewinds():
+    """Tests that the delimiter is detected and the stream position is restored."""
+    f = io.BytesIO(b"a;b\n1;2\n3;4\n")
+    assert _sniff_delimiter(f) == ";"
+    assert f.tell() == 0
+
+
+def test_load_csv_with_semicolon_delimiter():
+    """Tests that non-comma delimited files load into separate columns."""
+    f = io.BytesIO(b"Region;Sales\nNA;100\nEU;200\n")
+    df = load_tabular_data(f, "data.csv")
+
+    assert list(df.columns) == ["region", "sales"]
+    assert df["sales"].tolist() == [100, 200]
+
+
+def test_load_csv_keeps_quoted_delimiters():
+    """Tests that delimiters inside quoted fields do not split the field."""
+    f = io.BytesIO(b'name,tags\nA,"x,y"\nB,z\n')
+    df = load_tabular_data(f, "data.csv")
+
+    assert df["tags"].tolist() == ["x,y", "z"]
+
+
+def test_load_csv_keeps_timestamp_text_and_large_ints():
+    """Tests that the fast parser infers the same types as the python engine."""
+    f = io.BytesIO(
+        b"when,id\n"
+        b"2023-01-05T10:00:00,18446744073709551615\n"
+        b"2023-01-06T11:00:00,1\n"
+    )
+    df = load_tabular_data(f, "data.csv")
+
+    assert df["when"].tolist() == ["2023-01-05T10:00:00", "2023-01-06T11:00:00"]
+    assert df["id"].dtype == "uint64"
+
+
+# ==============================================================================
+# 2. Cleaning
+# ==============================================================================
+
+
+def test_load_csv_blank_cells_become_missing():
+    """Tests that whitespace-only cells are stripped to missing values."""
+    f = io.BytesIO(b"Col A,n\n  x  ,1\n   ,2\n")
+    df = load_tabular_data(f, "data.csv")
+
+    assert df["col_a"].iloc[0] == "x"
+    assert pd.isna(df["col_a"].iloc[1])
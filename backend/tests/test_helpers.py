@@ -0,0 +1,33 @@
+# tests/test_helpers.py
+
+import pandas as pd
+
+from backend.analysis.helpers import prepare_data_groups
+from backend.schemas import Filter, SummaryStatsAnalysis
+
+
+# ==============================================================================
+# 1. Row filters
+# ==============================================================================
+
+
+def test_filters_compare_only_rows_kept_by_earlier_filters():
+    """Tests that gt/lt filters skip mixed-type rows an earlier filter dropped."""
+    df = pd.DataFrame(
+        {
+            "g": ["u", "u", "v", "u"],
+            "s2": [1, 3, "text", 0],
+        }
+    )
+    step = SummaryStatsAnalysis(
+        output_name="Filter Order",
+        filters=[
+            Filter(column="g", operator="in", value=["u"]),
+            Filter(column="s2", operator="lt", value=2),
+        ],
+        numeric_columns=["s2"],
+    )
+
+    [(_, filtered)] = prepare_data_groups(df, step)
+
+    assert filtered.index.tolist() == [0, 3]
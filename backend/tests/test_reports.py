@@ -0,0 +1,28 @@
+# tests/test_reports.py
+
+from backend.routers.reports import (
+    _build_export_title_csv,
+    _build_run_scoped_filename,
+)
+
+
+# ==============================================================================
+# 1. Output naming
+# ==============================================================================
+
+
+def test_export_title_keeps_slashes_in_output_filename():
+    """Tests that only the extension is dropped from a free-text output title."""
+    assert _build_export_title_csv("Sales 3/2024.xlsx", "RID") == (
+        "Sales 3/2024,Run ID: RID\n\n"
+    )
+    assert _build_export_title_csv("Q1/Q2 report.xlsx", "RID").startswith(
+        "Q1/Q2 report,"
+    )
+
+
+def test_run_scoped_filename_inserts_run_id_before_extension():
+    """Tests that the run id goes before the last extension, if there is one."""
+    assert _build_run_scoped_filename("report.csv", "RID") == "report__RID.csv"
+    assert _build_run_scoped_filename("report", "RID") == "report__RID"
+    assert _build_run_scoped_filename(".hidden", "RID") == "__RID.hidden"
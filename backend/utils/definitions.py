@@ -1,4 +1,5 @@
 # backend/app/utils/definitions.py
+import functools
 
 # Master dictionary of statistical terms and their explanations
 # Key: The term (e.g., 'Coefficient', 'P-value', 'IQR')
@@ -217,10 +218,14 @@ STATISTICAL_DEFINITIONS = {
 
 
 # CRITICAL FIX: New function to generate a plain text string of all definitions
+@functools.lru_cache(maxsize=1)
 def get_all_definitions_as_text() -> str:
     """
     Formats all statistical definitions into a single, human-readable plain text string.
     Definitions are grouped by analysis type and sorted within groups.
+
+    The definitions are static, so the text (including the per-group sorts) is
+    built on the first request and served from the cache afterwards.
     """
     output_lines = ["--- Report Auto: Statistical Terminology Definitions ---", ""]
     output_lines.append(